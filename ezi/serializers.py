@@ -0,0 +1,71 @@
+class ModelJsonSerializer(object):
+    """
+    Converts objects of a model into the dictionary representation that is
+    sent to IanmannJsonResponse. This is a generated alternative to writing a
+    json method on the model by hand.
+
+    Which fields are serialized, and how, is worked out once from the model
+    when the serializer is instantiated. The model can customize this with the
+    json_fields and json_field_converters attributes. See doc/serializers.md.
+    """
+
+    def __init__(self, model_class):
+        """
+        Builds the list of keys, columns and converters for model_class.
+
+        If json_fields or json_field_converters on model_class name a field
+        that is not a concrete field on the model, or json_fields is a string
+        instead of a tuple of strings, then a ValueError is thrown.
+        """
+        self.model = model_class
+
+        fields_by_name = dict((f.name, f) for f in model_class._meta.concrete_fields)
+
+        field_names = getattr(model_class, "json_fields", None)
+        if field_names is None:
+            field_names = [f.name for f in model_class._meta.concrete_fields]
+        elif isinstance(field_names, (str, unicode)):
+            raise ValueError("Error on creating serializer for {0}. json_fields must be a tuple of field names, not the string '{1}'.".format(model_class.__name__, field_names))
+
+        field_converters = getattr(model_class, "json_field_converters", None)
+        if field_converters is None:
+            field_converters = {}
+
+        for attribute_name, names in (("json_fields", field_names), ("json_field_converters", field_converters)):
+            for field_name in names:
+                if field_name not in fields_by_name:
+                    raise ValueError("Error on creating serializer for {0}. '{1}' in {2} is not a concrete field on the model.".format(model_class.__name__, field_name, attribute_name))
+
+        self._keys = tuple(field_names)
+        self._columns = tuple(fields_by_name[name].attname for name in field_names)
+        self._converters = tuple(
+            (index, field_converters[name]) for index, name in enumerate(field_names) if name in field_converters
+        )
+
+    def _serialize_row(self, row):
+        """
+        Returns the dictionary representation of a single values_list() tuple
+        whose values are in the order of self._columns.
+        """
+        if self._converters:
+            row = list(row)
+            for index, convert in self._converters:
+                if row[index] is not None:
+                    row[index] = convert(row[index])
+        return dict(zip(self._keys, row))
+
+    def serialize_queryset(self, queryset):
+        """
+        Returns a list of the dictionary representations of each object in
+        queryset. The objects are read from the database as values_list()
+        tuples so queryset is never evaluated into model instances.
+        """
+        serialize_row = self._serialize_row
+        return [serialize_row(row) for row in queryset.values_list(*self._columns)]
+
+    def serialize_instance(self, instance):
+        """
+        Returns the dictionary representation of instance. This is used when a
+        model instance is already in memory, such as after it was created.
+        """
+        return self._serialize_row([getattr(instance, column) for column in self._columns])
@@ -0,0 +1,154 @@
+import json
+
+from django.db import connection, models
+from django.http import Http404
+from django.test import RequestFactory, TestCase
+
+from ezi.serializers import ModelJsonSerializer
+from ezi.views import model_crud_api_view_factory
+
+class Author(models.Model):
+    name = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "ezi"
+
+class Book(models.Model):
+    title = models.CharField(max_length=50)
+    author = models.ForeignKey(Author, on_delete=models.CASCADE)
+    pages = models.IntegerField(null=True)
+
+    json_field_converters = {"pages": lambda value: value * 2}
+
+    class Meta:
+        app_label = "ezi"
+
+    def json(self):
+        return {
+            "id": self.id,
+            "title": self.title,
+            "author": self.author_id,
+            "pages": self.pages * 2 if self.pages is not None else None
+        }
+
+class ModelTablesTestCase(TestCase):
+    """
+    ezi has no models module, so the tables for the models above are created
+    here instead of by the test database setup.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as editor:
+            editor.create_model(Author)
+            editor.create_model(Book)
+        super(ModelTablesTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super(ModelTablesTestCase, cls).tearDownClass()
+        with connection.schema_editor() as editor:
+            editor.delete_model(Book)
+            editor.delete_model(Author)
+
+class ModelJsonSerializerTest(ModelTablesTestCase):
+
+    def setUp(self):
+        self.author = Author.objects.create(name="Ann")
+        self.book = Book.objects.create(title="First", author=self.author, pages=10)
+        self.serializer = ModelJsonSerializer(Book)
+
+    def test_serialize_queryset_matches_json(self):
+        Book.objects.create(title="Second", author=self.author, pages=None)
+        books = Book.objects.order_by("pk")
+        self.assertEqual(self.serializer.serialize_queryset(books), [b.json() for b in books])
+
+    def test_foreign_key_is_pk_under_field_name(self):
+        result = self.serializer.serialize_instance(self.book)
+        self.assertEqual(result["author"], self.author.pk)
+        self.assertNotIn("author_id", result)
+
+    def test_converter_skipped_for_none(self):
+        self.book.pages = None
+        self.book.save()
+        self.assertEqual(self.serializer.serialize_queryset(Book.objects.all())[0]["pages"], None)
+
+    def test_serialize_instance_matches_serialize_queryset(self):
+        self.assertEqual(
+            self.serializer.serialize_instance(self.book),
+            self.serializer.serialize_queryset(Book.objects.filter(pk=self.book.pk))[0]
+        )
+
+    def test_empty_json_fields_serializes_no_fields(self):
+        class NoFieldsBook(Book):
+            json_fields = ()
+
+            class Meta:
+                proxy = True
+                app_label = "ezi"
+
+        serializer = ModelJsonSerializer(NoFieldsBook)
+        self.assertEqual(serializer.serialize_queryset(NoFieldsBook.objects.all()), [{}])
+
+    def test_bad_names_raise(self):
+        class StringFieldsBook(Book):
+            json_fields = "title"
+
+            class Meta:
+                proxy = True
+                app_label = "ezi"
+
+        class BadFieldBook(Book):
+            json_fields = ("title", "missing")
+
+            class Meta:
+                proxy = True
+                app_label = "ezi"
+
+        class BadConverterBook(Book):
+            json_field_converters = {"missing": str}
+
+            class Meta:
+                proxy = True
+                app_label = "ezi"
+
+        self.assertRaisesRegexp(ValueError, "json_fields must be a tuple", ModelJsonSerializer, StringFieldsBook)
+        self.assertRaisesRegexp(ValueError, "'missing' in json_fields", ModelJsonSerializer, BadFieldBook)
+        self.assertRaisesRegexp(ValueError, "'missing' in json_field_converters", ModelJsonSerializer, BadConverterBook)
+
+class ModelCrudApiViewSerializerTest(ModelTablesTestCase):
+
+    def setUp(self):
+        self.author = Author.objects.create(name="Ann")
+        self.book = Book.objects.create(title="First", author=self.author, pages=10)
+        self.request = RequestFactory().get("/")
+
+    def get_response_json(self, view_class, **kwargs):
+        response = view_class.as_view()(self.request, **kwargs)
+        return json.loads(response.content)["response"]
+
+    def test_factory_serializer_is_opt_in(self):
+        self.assertIsNone(model_crud_api_view_factory(Book).serializer)
+        self.assertIsInstance(model_crud_api_view_factory(Book, ModelJsonSerializer).serializer, ModelJsonSerializer)
+
+    def test_get_matches_json(self):
+        view_class = model_crud_api_view_factory(Book, ModelJsonSerializer)
+        self.assertEqual(self.get_response_json(view_class), [self.book.json()])
+        self.assertEqual(self.get_response_json(view_class, pk=self.book.pk), self.book.json())
+
+    def test_get_object_override_is_honored(self):
+        class HiddenBookView(model_crud_api_view_factory(Book, ModelJsonSerializer)):
+            def get_object(self):
+                raise Http404()
+
+        view = HiddenBookView()
+        view.request = self.request
+        view.instance_pk = self.book.pk
+        self.assertRaises(Http404, view.get_object_json)
+
+    def test_get_object_list_override_returning_list(self):
+        class ListBookView(model_crud_api_view_factory(Book, ModelJsonSerializer)):
+            def get_object_list(self):
+                return list(Book.objects.all())
+
+        self.assertEqual(self.get_response_json(ListBookView), [self.book.json()])
@@ -1,6 +1,9 @@
+from django.db.models.query import QuerySet
 from django.shortcuts import render, get_object_or_404
 from django.views.generic import View
 
+from serializers import ModelJsonSerializer
+
 from utils import (IanmannJsonResponse,
                     respond_bad_request_verb,
                     get_params_to_queryset_kwargs,
@@ -92,12 +95,18 @@ class ModelCrudApiView(ApiView):
             will be applied. This is only needed on GET and DELETE because these
             are the only methods that use a single active instance. PUT will
             ignore this field by default.
+
+        serializer - ModelJsonSerializer
+            Serializer used to convert objects of self.model to json. If this
+            is None, then the json method on each object is used instead.
     """
 
     model = None
 
     instance_pk = 0
 
+    serializer = None
+
     def dispatch(self, request, *args, **kwargs):
         """
         Override of the super classes dispatch.
@@ -132,14 +141,24 @@ class ModelCrudApiView(ApiView):
         """
         Simply gets the views object using self.get_object and returns its
         implementation of the json method.
+
+        If self.serializer is set, then the object is serialized by it instead
+        of by its json method.
         """
-        return self.get_object().json()
+        if self.serializer is None:
+            return self.get_object().json()
+
+        return self.serializer.serialize_instance(self.get_object())
 
     def get_object_list(self):
         """
         Returns a list of objects that are of the type denoted in self.model.
         The objects returned will be those that fulfill the parameters in the
         urls GET parameters.
+
+        Overrides may return either a QuerySet or a list of model instances. A
+        QuerySet is needed for self.serializer to read the rows without
+        building model instances.
         """
         kwargs_for_filter = self.get_params_to_queryset_kwargs("GET")
 
@@ -152,8 +171,19 @@ class ModelCrudApiView(ApiView):
         method on their model class.
 
         This method uses self.get_object_list to get the list of objects.
+
+        If self.serializer is set, then the objects are serialized by it
+        instead of by their json method. If self.get_object_list does not
+        return a QuerySet, then each object is serialized one at a time.
         """
-        return [x.json() for x in self.get_object_list()]
+        object_list = self.get_object_list()
+
+        if self.serializer is None:
+            return [x.json() for x in object_list]
+        elif isinstance(object_list, QuerySet):
+            return self.serializer.serialize_queryset(object_list)
+        else:
+            return [self.serializer.serialize_instance(x) for x in object_list]
 
     def create_object(self):
         """
@@ -192,7 +222,11 @@ class ModelCrudApiView(ApiView):
 
     def put(self, request, *args, **kwargs):
         """Creates an object and returns the resulting object in json format."""
-        return IanmannJsonResponse(self.create_object().json())
+        instance = self.create_object()
+        if self.serializer is None:
+            return IanmannJsonResponse(instance.json())
+
+        return IanmannJsonResponse(self.serializer.serialize_instance(instance))
 
     def get(self, request, *args, **kwargs):
         """
@@ -239,7 +273,7 @@ class ModelCrudApiView(ApiView):
             return respond_list_deleted(num_deleted)
 
 
-def model_crud_api_view_factory(model_class):
+def model_crud_api_view_factory(model_class, serializer_class=None):
     """
     Returns a class based view that contains default behavior for the ezi view
     ModelCrudApiView. This view is applied to the model_class and its __name__
@@ -247,10 +281,16 @@ def model_crud_api_view_factory(model_class):
 
     The allowed_methods in this view are GET, POST, PUT and DELETE.
     The model attribute for this view is the class in the parameter model_class.
+
+    If serializer_class is given (e.g. ModelJsonSerializer), then the
+    serializer attribute for this view is an instance of it built for
+    model_class. This is only built once, here. By default no serializer is
+    built and the view uses the json method on model_class.
     """
     class ApiView(ModelCrudApiView):
         model = model_class
         allowed_methods = ("GET", "POST", "PUT", "DELETE")
+        serializer = serializer_class(model_class) if serializer_class is not None else None
 
     ApiView.__name__ = "{model_name}CrudApiView".format(model_name=type(model_class).__name__)
 
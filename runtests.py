@@ -0,0 +1,20 @@
+"""
+Runs the ezi test suite against an in-memory sqlite database without needing
+a Django project. Usage: python runtests.py
+"""
+import sys
+
+import django
+from django.conf import settings
+from django.test.utils import get_runner
+
+settings.configure(
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    INSTALLED_APPS=["ezi"],
+)
+
+if __name__ == "__main__":
+    django.setup()
+    TestRunner = get_runner(settings)
+    failures = TestRunner().run_tests(["ezi"])
+    sys.exit(bool(failures))